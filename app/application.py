@@ -3,12 +3,13 @@ Main application class for the Quote Poster Generator.
 """
 import sys
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QMessageBox, QFileDialog
-from PyQt6.QtCore import Qt, QSize, QSettings
-from PyQt6.QtGui import QIcon, QAction, QPixmap
+from PyQt6.QtCore import Qt, QSize, QSettings, QTimer
+from PyQt6.QtGui import QIcon, QAction, QPixmap, QPixmapCache
 
 from .ui.main_window import MainWindow
 from .utils.config import ConfigManager
@@ -22,7 +23,7 @@ class QuotePosterApp(QApplication):
         
         Args:
             argv: Command line arguments.
-        ""
+        """
         super().__init__(argv)
         
         # Set application information
@@ -30,21 +31,27 @@ class QuotePosterApp(QApplication):
         self.setApplicationVersion("1.0.0")
         self.setOrganizationName("MQPG")
         
+        # Room for decoded backgrounds and scaled previews (in KB)
+        QPixmapCache.setCacheLimit(100 * 1024)
+        
         # Initialize components
         self.config = ConfigManager()
-        self.resource_manager = ResourceManager()
         
         # Create and show the main window
-        self.main_window = MainWindow(self)
+        self.main_window = MainWindow()
         
         # Load settings
         self.load_settings()
     
+    @cached_property
+    def resource_manager(self) -> ResourceManager:
+        """Resource manager, created on first use to keep startup fast."""
+        return ResourceManager()
+    
     def load_settings(self) -> None:
         """Load application settings."""
         # Load window geometry and state
-        geometry = self.config.load_window_geometry()
-        state = self.config.load_window_state()
+        geometry, state = self.config.load_window()
         
         if geometry:
             self.main_window.restoreGeometry(geometry)
@@ -75,11 +82,20 @@ class QuotePosterApp(QApplication):
             int: Exit code.
         """
         self.main_window.show()
+        
+        # Defer non-critical initialization until the window is on screen
+        QTimer.singleShot(0, self._post_show_init)
+        
         return self.exec()
     
+    def _post_show_init(self) -> None:
+        """Initialize components that aren't needed for the first paint."""
+        self.resource_manager.preload_fonts_async()
+    
     def about_to_quit(self) -> None:
         """Handle application quit event."""
         self.save_settings()
+        self.config.flush()
 
 
 def main():
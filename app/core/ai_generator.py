@@ -4,34 +4,164 @@ Supports both OpenAI and Azure OpenAI services.
 """
 import os
 import base64
+import functools
+import hashlib
+import importlib.util
+import re
+import threading
 import requests
-from typing import Optional, Dict, Any, List, Tuple, Union
-from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Union
+from dataclasses import dataclass, replace
 from pathlib import Path
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 
-from PyQt6.QtCore import QObject, pyqtSignal, QThread, QSize
-from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtCore import (
+    QObject, pyqtSignal, QRunnable, QThreadPool, QSize, QByteArray, QBuffer,
+    QIODevice, QStandardPaths
+)
+from PyQt6.QtGui import QPixmap, QImage, QImageReader
 
-from openai import OpenAI, AzureOpenAI
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+if TYPE_CHECKING:
+    from openai import OpenAI, AzureOpenAI
 
-# Configuration
-AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
-AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
-AZURE_OPENAI_API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION", "2023-05-15")
-AZURE_DEPLOYMENT_NAME = os.getenv("AZURE_DEPLOYMENT_NAME", "dall-e-3")
+@functools.lru_cache(maxsize=1)
+def _load_env() -> Dict[str, Optional[str]]:
+    """Load the AI configuration, reading the .env file on first use only.
+    
+    Returns:
+        Dict[str, Optional[str]]: The configuration values by variable name.
+    """
+    load_dotenv()
+    return {
+        "AZURE_OPENAI_ENDPOINT": os.getenv("AZURE_OPENAI_ENDPOINT"),
+        "AZURE_OPENAI_API_KEY": os.getenv("AZURE_OPENAI_API_KEY"),
+        "AZURE_OPENAI_API_VERSION": os.getenv("AZURE_OPENAI_API_VERSION", "2023-05-15"),
+        "AZURE_DEPLOYMENT_NAME": os.getenv("AZURE_DEPLOYMENT_NAME", "dall-e-3"),
+        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY"),
+    }
+
+# Friendly messages for known API error codes, matched in a single scan
+_ERROR_MESSAGES = {
+    "rate_limit": "API rate limit exceeded. Please try again later.",
+    "invalid_api_key": "Invalid API key. Please check your API key in settings.",
+    "billing_hard_limit_reached": "Billing hard limit reached. Please check your OpenAI account.",
+}
+_ERROR_PATTERN = re.compile("|".join(map(re.escape, _ERROR_MESSAGES)), re.IGNORECASE)
+
+# Maximum number of generated backgrounds kept in the disk cache
+_CACHE_MAX_ENTRIES = 100
+
+# HTTP/2 lets concurrent generations share one connection; it needs the optional h2 package
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# API clients are cached per (is_azure, api_key) so connections are reused
+# across generations instead of re-doing the TLS handshake every time.
+_client_cache: Dict[Tuple[bool, str], "Union[OpenAI, AzureOpenAI]"] = {}
+_client_lock = threading.Lock()
+
+# Shared keep-alive session for downloading generated images
+_http_session = requests.Session()
+_http_session.headers["Connection"] = "keep-alive"
+_http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+def _get_client(is_azure: bool, api_key: str) -> "Union[OpenAI, AzureOpenAI]":
+    """Get a cached OpenAI or Azure OpenAI client, creating it on first use.
+    
+    Args:
+        is_azure: Whether to use Azure OpenAI.
+        api_key: The API key for the service.
+        
+    Returns:
+        Union[OpenAI, AzureOpenAI]: The client for the given configuration.
+    """
+    key = (is_azure, api_key)
+    # Tasks run on pool threads; hold the lock so two concurrent first
+    # uses don't each build a client and leak the loser's connections
+    with _client_lock:
+        client = _client_cache.get(key)
+        if client is None:
+            # Imported lazily: the SDK is slow to import and only needed once
+            # the user actually generates a background
+            import httpx
+            from openai import OpenAI, AzureOpenAI
+            
+            http_client = httpx.Client(
+                http2=_HTTP2_AVAILABLE,
+                timeout=httpx.Timeout(120.0, connect=10.0),
+                follow_redirects=True,
+            )
+            if is_azure:
+                env = _load_env()
+                client = AzureOpenAI(
+                    api_key=api_key,
+                    api_version=env["AZURE_OPENAI_API_VERSION"],
+                    azure_endpoint=env["AZURE_OPENAI_ENDPOINT"],
+                    http_client=http_client,
+                )
+            else:
+                client = OpenAI(api_key=api_key, http_client=http_client)
+            _client_cache[key] = client
+        return client
+
+def _get_cache_path(prompt: str, size: str, model: str) -> Path:
+    """Get the disk cache path for a generated background.
+    
+    Args:
+        prompt: The text prompt the image was generated from.
+        size: The image size string (e.g. "1024x1024").
+        model: The model or deployment that generated the image.
+        
+    Returns:
+        Path: Path of the cached PNG file (which may not exist yet).
+    """
+    cache_dir = Path(QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.CacheLocation
+    )) / 'ai_backgrounds'
+    key = hashlib.sha256(f"{prompt}|{size}|{model}".encode('utf-8')).hexdigest()
+    return cache_dir / f"{key}.png"
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Delete the least recently used backgrounds beyond the cache limit.
+    
+    Args:
+        cache_dir: The disk cache directory.
+    """
+    try:
+        entries = sorted(cache_dir.glob('*.png'), key=lambda p: p.stat().st_mtime)
+        for path in entries[:max(0, len(entries) - _CACHE_MAX_ENTRIES)]:
+            path.unlink()
+    except OSError as e:
+        print(f"Error pruning AI background cache: {e}")
 
 @dataclass
 class AIGenerationResult:
     """Represents the result of an AI image generation request."""
     success: bool
-    image: Optional[QPixmap] = None
+    # Tasks produce a QImage (QPixmap is GUI-thread only); AIGenerator
+    # converts it to a QPixmap on the GUI thread before emitting the result.
+    image: Optional[Union[QImage, QPixmap]] = None
     error: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
+def _to_pixmap_result(result: AIGenerationResult) -> AIGenerationResult:
+    """Convert a task result's QImage into a QPixmap.
+    
+    Must be called on the GUI thread.
+    
+    Args:
+        result: The result produced by a generation task.
+        
+    Returns:
+        AIGenerationResult: The result with a QPixmap image.
+    """
+    if isinstance(result.image, QImage):
+        return replace(result, image=QPixmap.fromImage(result.image))
+    return result
+
 class AIGenerationError(Exception):
     """Exception raised for AI generation errors."""
     pass
@@ -42,6 +172,7 @@ class AIGenerator(QObject):
     # Signals
     generation_started = pyqtSignal()
     generation_finished = pyqtSignal(AIGenerationResult)
+    batch_finished = pyqtSignal(list)  # List[AIGenerationResult], in prompt order
     progress_updated = pyqtSignal(int)  # 0-100
     
     def __init__(self, api_key: Optional[str] = None):
@@ -51,9 +182,14 @@ class AIGenerator(QObject):
             api_key: Optional API key. If not provided, will try to get from environment.
         """
         super().__init__()
-        self.api_key = api_key or AZURE_OPENAI_API_KEY or os.getenv("OPENAI_API_KEY")
-        self._worker = None
-        self._is_azure = bool(AZURE_OPENAI_ENDPOINT and self.api_key)
+        env = _load_env()
+        self.api_key = api_key or env["AZURE_OPENAI_API_KEY"] or env["OPENAI_API_KEY"]
+        self._task = None
+        self._batch_tasks: List[AIGenerationTask] = []
+        self._batch_results: List[Optional[AIGenerationResult]] = []
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(4)
+        self._is_azure = bool(env["AZURE_OPENAI_ENDPOINT"] and self.api_key)
     
     def is_configured(self) -> bool:
         """Check if the AI generator is properly configured.
@@ -62,7 +198,7 @@ class AIGenerator(QObject):
             bool: True if configured, False otherwise.
         """
         if self._is_azure:
-            return bool(self.api_key and AZURE_OPENAI_ENDPOINT)
+            return bool(self.api_key and _load_env()["AZURE_OPENAI_ENDPOINT"])
         return bool(self.api_key)
     
     def set_api_key(self, api_key: str) -> None:
@@ -73,12 +209,15 @@ class AIGenerator(QObject):
         """
         self.api_key = api_key
     
-    def generate_background(self, prompt: str, size: Tuple[int, int] = (1024, 1024)) -> None:
+    def generate_background(self, prompt: str, size: Tuple[int, int] = (1024, 1024),
+                            use_cache: bool = True) -> None:
         """Generate a background image using AI.
         
         Args:
             prompt: The text prompt to generate an image from.
             size: The desired size of the generated image (width, height).
+            use_cache: Whether a previously generated image for the same
+                request may be reused. Pass False to always get a new image.
         """
         if not self.is_configured():
             result = AIGenerationResult(
@@ -91,19 +230,63 @@ class AIGenerator(QObject):
         # Cancel any ongoing generation
         self.cancel_generation()
         
-        # Create and start a worker thread
-        self._worker = AIGenerationWorker(self.api_key, prompt, size, self._is_azure)
-        self._worker.finished.connect(self._on_generation_finished)
-        self._worker.progress_updated.connect(self.progress_updated.emit)
+        # Create a task and hand it to the thread pool
+        self._task = AIGenerationTask(self.api_key, prompt, size, self._is_azure, use_cache)
+        self._task.signals.finished.connect(self._on_generation_finished)
+        self._task.signals.progress_updated.connect(self.progress_updated.emit)
         
         self.generation_started.emit()
-        self._worker.start()
+        self._pool.start(self._task)
+    
+    def generate_batch(self, prompts: List[str], size: Tuple[int, int] = (1024, 1024)) -> None:
+        """Generate background images for several prompts concurrently.
+        
+        The requests run in parallel on the generator's thread pool, so the
+        batch takes roughly as long as its slowest request. The pool size
+        bounds how many requests are in flight at once.
+        
+        Args:
+            prompts: The text prompts to generate images from.
+            size: The desired size of the generated images (width, height).
+        """
+        if not self.is_configured():
+            result = AIGenerationResult(
+                success=False,
+                error="OpenAI API key not configured. Please set your API key in settings."
+            )
+            self.batch_finished.emit([result] * len(prompts))
+            return
+        
+        # Cancel any ongoing batch
+        self.cancel_batch()
+        
+        if not prompts:
+            self.batch_finished.emit([])
+            return
+        
+        self._batch_tasks = [
+            AIGenerationTask(self.api_key, prompt, size, self._is_azure)
+            for prompt in prompts
+        ]
+        self._batch_results = [None] * len(prompts)
+        
+        self.generation_started.emit()
+        for task in self._batch_tasks:
+            task.signals.finished.connect(self._on_batch_task_finished)
+            self._pool.start(task)
+    
+    def cancel_batch(self) -> None:
+        """Cancel the current batch generation."""
+        for task in self._batch_tasks:
+            task.cancel()
+        self._batch_tasks = []
+        self._batch_results = []
     
     def cancel_generation(self) -> None:
         """Cancel the current generation process."""
-        if self._worker and self._worker.isRunning():
-            self._worker.cancel()
-            self._worker.wait()
+        if self._task:
+            self._task.cancel()
+            self._task = None
     
     def _on_generation_finished(self, result: AIGenerationResult) -> None:
         """Handle the completion of a generation task.
@@ -111,60 +294,120 @@ class AIGenerator(QObject):
         Args:
             result: The generation result.
         """
-        self._worker = None
-        self.generation_finished.emit(result)
+        # Ignore results from tasks that were cancelled or superseded
+        if self._task is None or self.sender() is not self._task.signals:
+            return
+        
+        self._task = None
+        self.generation_finished.emit(_to_pixmap_result(result))
+
+    def _on_batch_task_finished(self, result: AIGenerationResult) -> None:
+        """Collect the result of one task in a batch.
+        
+        Args:
+            result: The generation result.
+        """
+        sender = self.sender()
+        index = next(
+            (i for i, task in enumerate(self._batch_tasks) if task.signals is sender),
+            None
+        )
+        if index is None:
+            return
+        
+        self._batch_results[index] = _to_pixmap_result(result)
+        done = sum(r is not None for r in self._batch_results)
+        self.progress_updated.emit(done * 100 // len(self._batch_results))
+        
+        if done == len(self._batch_results):
+            results = self._batch_results
+            self._batch_tasks = []
+            self._batch_results = []
+            self.batch_finished.emit(results)
 
-class AIGenerationWorker(QThread):
-    """Worker thread for AI generation tasks."""
+class AIGenerationTask(QRunnable):
+    """Thread pool task for AI generation."""
     
-    finished = pyqtSignal(AIGenerationResult)
-    progress_updated = pyqtSignal(int)
+    class Signals(QObject):
+        """Signals emitted by the task (QRunnable is not a QObject)."""
+        finished = pyqtSignal(AIGenerationResult)
+        progress_updated = pyqtSignal(int)
     
-    def __init__(self, api_key: str, prompt: str, size: Tuple[int, int], is_azure: bool):
-        """Initialize the worker.
+    def __init__(self, api_key: str, prompt: str, size: Tuple[int, int], is_azure: bool,
+                 use_cache: bool = True):
+        """Initialize the task.
         
         Args:
             api_key: The OpenAI API key.
             prompt: The text prompt for image generation.
             size: The desired image size (width, height).
             is_azure: Whether to use Azure OpenAI.
+            use_cache: Whether a cached image for the same request may be
+                returned instead of calling the API.
         """
         super().__init__()
+        self.signals = AIGenerationTask.Signals()
         self.api_key = api_key
         self.prompt = prompt
         self.size = size
         self._is_azure = is_azure
-        self._is_cancelled = False
+        self._use_cache = use_cache
+        self._cancelled = threading.Event()
     
     def run(self) -> None:
         """Run the generation task."""
         try:
-            self.progress_updated.emit(10)
+            self.signals.progress_updated.emit(10)
             
-            if self._is_azure and AZURE_OPENAI_ENDPOINT and self.api_key:
-                # Azure OpenAI client
-                client = AzureOpenAI(
-                    api_key=self.api_key,
-                    api_version=AZURE_OPENAI_API_VERSION,
-                    azure_endpoint=AZURE_OPENAI_ENDPOINT,
-                )
-                
+            env = _load_env()
+            size_str = f"{self.size[0]}x{self.size[1]}"
+            model = env["AZURE_DEPLOYMENT_NAME"] if self._is_azure else "dall-e-3"
+            
+            # Reuse a previously generated image for the same request; cache
+            # errors only mean the image is generated again
+            cache_path = _get_cache_path(self.prompt, size_str, model)
+            cached_image = None
+            try:
+                if self._use_cache and cache_path.exists():
+                    image = QImage(str(cache_path))
+                    if not image.isNull():
+                        os.utime(cache_path)  # Mark as recently used
+                        cached_image = image
+            except OSError as e:
+                print(f"Error reading AI background cache: {e}")
+            
+            if cached_image is not None:
+                self.signals.progress_updated.emit(100)
+                self.signals.finished.emit(AIGenerationResult(
+                    success=True,
+                    image=cached_image,
+                    metadata={
+                    "model": model,
+                    "size": size_str,
+                    "revised_prompt": cached_image.text("revised_prompt") or self.prompt,
+                    "cached": True
+                }
+                ))
+                return
+            
+            if self._is_azure and env["AZURE_OPENAI_ENDPOINT"] and self.api_key:
                 # Azure OpenAI requires a deployment name
+                client = _get_client(True, self.api_key)
                 response = client.images.generate(
-                    model=AZURE_DEPLOYMENT_NAME,
+                    model=model,
                     prompt=self.prompt,
-                    size=f"{self.size[0]}x{self.size[1]}",
+                    size=size_str,
                     quality="standard",
                     n=1,
                     response_format="url"  # Request URL response format
                 )
             elif self.api_key:
                 # Standard OpenAI client
-                client = OpenAI(api_key=self.api_key)
+                client = _get_client(False, self.api_key)
                 response = client.images.generate(
-                    model="dall-e-3",
+                    model=model,
                     prompt=self.prompt,
-                    size=f"{self.size[0]}x{self.size[1]}",
+                    size=size_str,
                     quality="standard",
                     n=1,
                     response_format="url"  # Request URL response format
@@ -172,10 +415,10 @@ class AIGenerationWorker(QThread):
             else:
                 raise AIGenerationError("No valid API configuration found")
             
-            if self._is_cancelled:
+            if self._cancelled.is_set():
                 return
             
-            self.progress_updated.emit(30)
+            self.signals.progress_updated.emit(30)
             
             # Get the image URL from the response
             if not response.data or not hasattr(response.data[0], 'url') or not response.data[0].url:
@@ -186,70 +429,86 @@ class AIGenerationWorker(QThread):
             # Download the image
             headers = {}
             if 'openai.azure.com' in str(image_url):
-                # Add API key as a query parameter for Azure OpenAI
-                if '?' in image_url:
-                    image_url += f"&api-version={AZURE_OPENAI_API_VERSION}"
-                else:
-                    image_url += f"?api-version={AZURE_OPENAI_API_VERSION}"
+                # Azure OpenAI needs the API version in the query and the key in a header
+                url = urlparse(image_url)
+                query = dict(parse_qsl(url.query, keep_blank_values=True))
+                query["api-version"] = env["AZURE_OPENAI_API_VERSION"]
+                image_url = urlunparse(url._replace(query=urlencode(query)))
                 headers["api-key"] = self.api_key
             
-            # Download the image with proper headers
-            image_response = requests.get(image_url, headers=headers)
-            image_response.raise_for_status()
-            image_data = image_response.content
+            # Stream the image straight into a Qt buffer instead of
+            # materializing the whole response as Python bytes first
+            image_data = QByteArray()
+            with _http_session.get(image_url, headers=headers, stream=True, timeout=30) as image_response:
+                image_response.raise_for_status()
+                
+                # Size the buffer up front so appending chunks never reallocates
+                content_length = image_response.headers.get("Content-Length", "")
+                if content_length.isdigit():
+                    image_data.reserve(int(content_length))
+                
+                for chunk in image_response.iter_content(chunk_size=65536):
+                    if self._cancelled.is_set():
+                        return
+                    image_data.append(chunk)
             
-            # Convert to QPixmap
-            image = QImage()
-            if not image.loadFromData(image_data):
-                # Try different image formats if the default loading fails
-                for fmt in [b'PNG', b'JPEG', b'BMP', b'GIF']:
-                    if image.loadFromData(image_data, fmt):
-                        break
-                else:
-                    raise AIGenerationError("Failed to load image data")
+            # Decode the image, sniffing the format from its header once
+            buffer = QBuffer(image_data)
+            buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+            reader = QImageReader(buffer)
+            reader.setDecideFormatFromContent(True)
+            image = reader.read()
+            if image.isNull():
+                raise AIGenerationError(f"Failed to load image data: {reader.errorString()}")
                     
-            pixmap = QPixmap.fromImage(image)
+            if self._cancelled.is_set():
+                return
             
-            if pixmap.isNull():
-                raise AIGenerationError("Failed to create valid image from response")
+            revised_prompt = getattr(response.data[0], 'revised_prompt', self.prompt)
             
-            if self._is_cancelled:
-                return
+            # Keep a copy on disk so identical requests skip the API; a failed
+            # write doesn't affect the generated image. The revised prompt is
+            # stored as PNG text so cache hits can report it too.
+            if revised_prompt:
+                image.setText("revised_prompt", revised_prompt)
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                if image.save(str(cache_path), "PNG"):
+                    _prune_cache(cache_path.parent)
+            except OSError as e:
+                print(f"Error writing AI background cache: {e}")
             
-            self.progress_updated.emit(90)
+            self.signals.progress_updated.emit(90)
             
             # Create the result
             result = AIGenerationResult(
                 success=True,
-                image=pixmap,
+                image=image,
                 metadata={
-                    "model": "dall-e-3",
+                    "model": model,
                     "size": size_str,
-                    "revised_prompt": getattr(response.data[0], 'revised_prompt', self.prompt)
+                    "revised_prompt": revised_prompt
                 }
             )
             
-            self.progress_updated.emit(100)
-            self.finished.emit(result)
+            self.signals.progress_updated.emit(100)
+            self.signals.finished.emit(result)
             
         except Exception as e:
             error_msg = str(e)
-            if "rate_limit" in error_msg.lower():
-                error_msg = "API rate limit exceeded. Please try again later."
-            elif "invalid_api_key" in error_msg.lower():
-                error_msg = "Invalid API key. Please check your API key in settings."
-            elif "billing_hard_limit_reached" in error_msg.lower():
-                error_msg = "Billing hard limit reached. Please check your OpenAI account."
+            match = _ERROR_PATTERN.search(error_msg)
+            if match:
+                error_msg = _ERROR_MESSAGES[match.group(0).lower()]
             
             result = AIGenerationResult(
                 success=False,
                 error=f"AI generation failed: {error_msg}"
             )
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
     
     def cancel(self) -> None:
         """Cancel the generation task."""
-        self._is_cancelled = True
+        self._cancelled.set()
 
 # Example usage:
 if __name__ == "__main__":
@@ -259,7 +518,7 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     
     # Get API key from environment or user input
-    api_key = os.getenv("OPENAI_API_KEY")
+    api_key = _load_env()["OPENAI_API_KEY"]
     if not api_key:
         api_key = input("Enter your OpenAI API key: ")
     
@@ -6,8 +6,17 @@ from enum import Enum
 from typing import Optional, Tuple
 from pathlib import Path
 
-from PyQt6.QtGui import QPixmap, QPainter, QColor, QFont, QImage
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap, QPixmapCache, QPainter, QColor, QFont, QImage, QStaticText, QTextOption, QTransform
+from PyQt6.QtCore import Qt, QPointF, QRect
+
+from ..utils.image_utils import find_cached_pixmap
+
+# Lossy formats chosen by file extension in save_poster
+_LOSSY_FORMATS = {
+    '.jpg': 'JPEG',
+    '.jpeg': 'JPEG',
+    '.webp': 'WEBP',
+}
 
 class TextAlignment(Enum):
     """Text alignment options."""
@@ -15,6 +24,29 @@ class TextAlignment(Enum):
     CENTER = Qt.AlignmentFlag.AlignCenter
     RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
 
+def _text_layout(alignment: TextAlignment) -> Tuple[QTextOption, float]:
+    """Split an alignment into a word-wrapping text option and a vertical factor.
+    
+    Args:
+        alignment: The text alignment.
+        
+    Returns:
+        Tuple[QTextOption, float]: The option for the horizontal layout and the
+        fraction of the free vertical space to place above the text.
+    """
+    option = QTextOption(alignment.value & Qt.AlignmentFlag.AlignHorizontal_Mask)
+    option.setWrapMode(QTextOption.WrapMode.WordWrap)
+    
+    vertical = alignment.value & Qt.AlignmentFlag.AlignVertical_Mask
+    if vertical == Qt.AlignmentFlag.AlignVCenter:
+        return option, 0.5
+    if vertical == Qt.AlignmentFlag.AlignBottom:
+        return option, 1.0
+    return option, 0.0
+
+# Layout data per alignment, computed once instead of on every render
+_TEXT_LAYOUTS = {alignment: _text_layout(alignment) for alignment in TextAlignment}
+
 @dataclass
 class PosterSettings:
     """Settings for generating a quote poster."""
@@ -26,6 +58,8 @@ class PosterSettings:
     padding: int = 40
     background_color: QColor = QColor("#333333")
     size: Tuple[int, int] = (800, 600)
+    # FastTransformation is much cheaper for interactive previews
+    transform_mode: Qt.TransformationMode = Qt.TransformationMode.SmoothTransformation
 
 class PosterGenerator:
     """Handles the generation of quote posters."""
@@ -33,6 +67,10 @@ class PosterGenerator:
     def __init__(self, settings: Optional[PosterSettings] = None):
         """Initialize with optional settings."""
         self.settings = settings or PosterSettings()
+        self._bg_cache: Optional[Tuple[tuple, QPixmap]] = None
+        self._static_text: Optional[Tuple[tuple, QStaticText]] = None
+        self._font_cache: Optional[Tuple[str, int, QFont]] = None
+        self._last_render: Optional[Tuple[tuple, QPixmap]] = None
     
     def set_background_from_file(self, file_path: str) -> bool:
         """Set the background from an image file.
@@ -43,10 +81,20 @@ class PosterGenerator:
         Returns:
             bool: True if the background was set successfully, False otherwise.
         """
-        if not Path(file_path).exists():
+        path = Path(file_path)
+        if not path.exists():
             return False
-            
-        self.background = QPixmap(file_path)
+        
+        # Reuse the decoded image if this file was loaded before and hasn't changed
+        key = f"background:{path.resolve()}:{path.stat().st_mtime_ns}"
+        pixmap = find_cached_pixmap(key)
+        if pixmap is None:
+            pixmap = QPixmap(file_path)
+            if not pixmap.isNull():
+                QPixmapCache.insert(key, pixmap)
+        
+        self.background = pixmap
+        self._bg_cache = None
         return not self.background.isNull()
     
     def set_background_from_pixmap(self, pixmap: QPixmap) -> None:
@@ -56,41 +104,157 @@ class PosterGenerator:
             pixmap: The QPixmap to use as background.
         """
         self.background = pixmap
+        self._bg_cache = None
+    
+    def _get_scaled_background(self) -> QPixmap:
+        """Get the background scaled to cover the poster size.
+        
+        The result is cached until the background, the poster size or the
+        transform mode changes, so text-only edits don't rescale the image.
+        
+        Returns:
+            QPixmap: The scaled (uncropped) background.
+        """
+        key = (self.background.cacheKey(), self.settings.size, self.settings.transform_mode)
+        if self._bg_cache is not None and self._bg_cache[0] == key:
+            return self._bg_cache[1]
+        
+        # Scale the background to the desired size while maintaining aspect ratio
+        pixmap = self.background.scaled(
+            *self.settings.size,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            self.settings.transform_mode
+        )
+        
+        self._bg_cache = (key, pixmap)
+        return pixmap
+    
+    def _get_font(self) -> QFont:
+        """Get the poster font, rebuilt only when the family or size changes.
+        
+        Returns:
+            QFont: The font for the quote text.
+        """
+        key = (self.settings.font_family, self.settings.font_size)
+        if self._font_cache is None or self._font_cache[:2] != key:
+            self._font_cache = (*key, QFont(*key))
+        return self._font_cache[2]
+    
+    def _get_static_text(self, font: QFont, width: int) -> QStaticText:
+        """Get the quote laid out for the given font and width.
+        
+        The shaped and word-wrapped layout is cached, so redrawing the same
+        text (e.g. with another color or background) skips text shaping.
+        
+        Args:
+            font: The font to lay out the text with.
+            width: The width to wrap the text at.
+            
+        Returns:
+            QStaticText: The prepared text.
+        """
+        # QStaticText ignores '\n'; use QChar::LineSeparator like drawText does
+        text = self.settings.text.replace('\n', '\u2028')
+        
+        key = (
+            text,
+            self.settings.font_family,
+            self.settings.font_size,
+            self.settings.alignment,
+            width
+        )
+        if self._static_text is not None and self._static_text[0] == key:
+            return self._static_text[1]
+        
+        # Horizontal alignment is handled by the layout, vertical by the caller
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.setTextOption(_TEXT_LAYOUTS[self.settings.alignment][0])
+        static_text.setTextWidth(width)
+        static_text.prepare(QTransform(), font)
+        
+        self._static_text = (key, static_text)
+        return static_text
+    
+    def _render_key(self) -> tuple:
+        """Build a key identifying everything that affects the rendered poster.
+        
+        Returns:
+            tuple: The render key for the current settings and background.
+        """
+        settings = self.settings
+        has_background = hasattr(self, 'background') and not self.background.isNull()
+        return (
+            settings.text,
+            settings.font_family,
+            settings.font_size,
+            settings.text_color.rgba(),
+            settings.alignment,
+            settings.padding,
+            settings.background_color.rgba(),
+            settings.size,
+            settings.transform_mode,
+            self.background.cacheKey() if has_background else None
+        )
     
     def generate_poster(self) -> QPixmap:
         """Generate a poster with the current settings.
         
+        If neither the settings nor the background changed since the last
+        call, the previous poster is returned without re-rendering.
+        
         Returns:
             QPixmap: The generated poster.
         """
+        key = self._render_key()
+        if self._last_render is None or self._last_render[0] != key:
+            self._last_render = (key, self._render_poster())
+        
+        # Hand out an implicitly shared copy so callers can't alter the cache
+        return QPixmap(self._last_render[1])
+    
+    def _render_poster(self) -> QPixmap:
+        """Render a poster with the current settings.
+        
+        Returns:
+            QPixmap: The rendered poster.
+        """
+        width, height = self.settings.size
+        pixmap = QPixmap(width, height)
+        
         # Create a blank image if no background is set
         if not hasattr(self, 'background') or self.background.isNull():
-            pixmap = QPixmap(*self.settings.size)
             pixmap.fill(self.settings.background_color)
+            background = None
         else:
-            # Scale the background to the desired size while maintaining aspect ratio
-            pixmap = self.background.scaled(
-                *self.settings.size,
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            
-            # Crop to the exact size if needed
-            if pixmap.size() != self.settings.size:
-                x = (pixmap.width() - self.settings.size[0]) // 2
-                y = (pixmap.height() - self.settings.size[1]) // 2
-                pixmap = pixmap.copy(x, y, *self.settings.size)
-        
-        # If there's no text, return the background as is
-        if not self.settings.text.strip():
-            return pixmap
+            # A new QPixmap's contents are undefined; clear it so transparent
+            # parts of the background don't blend over garbage
+            pixmap.fill(Qt.GlobalColor.transparent)
+            background = self._get_scaled_background()
         
         # Create a painter to draw on the pixmap
         painter = QPainter(pixmap)
         
         try:
+            if background is not None:
+                # Draw the centered part of the scaled background directly
+                # instead of cropping it into an intermediate copy first
+                source = QRect(
+                    (background.width() - width) // 2,
+                    (background.height() - height) // 2,
+                    width,
+                    height
+                )
+                painter.drawPixmap(pixmap.rect(), background, source)
+            
+            # If there's no text, return the background as is
+            if not self.settings.text.strip():
+                return pixmap
+            
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
+            
             # Set up the font
-            font = QFont(self.settings.font_family, self.settings.font_size)
+            font = self._get_font()
             painter.setFont(font)
             painter.setPen(self.settings.text_color)
             
@@ -102,30 +266,40 @@ class PosterGenerator:
                 -self.settings.padding
             )
             
-            # Draw the text with word wrap and alignment
-            painter.drawText(
-                rect,
-                self.settings.alignment.value | Qt.TextFlag.TextWordWrap,
-                self.settings.text
-            )
+            # Draw the pre-laid-out text, positioned vertically within the rect
+            static_text = self._get_static_text(font, rect.width())
+            vertical_factor = _TEXT_LAYOUTS[self.settings.alignment][1]
+            y = rect.top() + (rect.height() - static_text.size().height()) * vertical_factor
+            
+            # drawStaticText doesn't clip like drawText(rect, ...) did
+            painter.setClipRect(rect)
+            painter.drawStaticText(QPointF(rect.left(), y), static_text)
             
         finally:
             painter.end()
         
         return pixmap
     
-    def save_poster(self, file_path: str, format: str = "PNG") -> bool:
+    def save_poster(self, file_path: str, format: str = "PNG", quality: int = 90) -> bool:
         """Save the generated poster to a file.
         
+        ".jpg"/".jpeg" and ".webp" files are written with the matching lossy
+        encoder, which is much faster than PNG's deflate for photographic
+        backgrounds; any other extension uses the given format.
+        
         Args:
             file_path: Path where to save the file.
             format: Image format (e.g., "PNG", "JPEG").
+            quality: Quality for lossy formats (1-100).
             
         Returns:
             bool: True if the file was saved successfully, False otherwise.
         """
         try:
             poster = self.generate_poster()
+            format = _LOSSY_FORMATS.get(Path(file_path).suffix.lower(), format)
+            if format in _LOSSY_FORMATS.values():
+                return poster.save(file_path, format, max(1, min(100, quality)))
             return poster.save(file_path, format)
         except Exception as e:
             print(f"Error saving poster: {e}")
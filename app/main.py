@@ -0,0 +1,13 @@
+"""
+Console entry point for the Quote Poster Generator application.
+"""
+import sys
+
+from .application import main as run_application
+
+def main():
+    """Initialize and start the application."""
+    sys.exit(run_application())
+
+if __name__ == "__main__":
+    main()
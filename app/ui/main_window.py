@@ -7,11 +7,194 @@ from PyQt6.QtWidgets import (
     QColorDialog, QTextEdit, QFrame, QGroupBox,
     QListWidget, QListWidgetItem, QDialog, QDialogButtonBox, QSlider
 )
-from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal, QEventLoop
-from PyQt6.QtGui import QPixmap, QColor, QFont, QPainter, QImage, QIcon
+from PyQt6.QtCore import (
+    Qt, QSize, QPointF, QTimer, pyqtSignal, QObject, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import (
+    QPixmap, QPixmapCache, QColor, QFont, QPainter, QImage, QImageReader, QImageWriter, QIcon,
+    QStaticText, QTextOption, QTransform
+)
 import os
+import threading
 from pathlib import Path
 
+from app.utils.image_utils import find_cached_pixmap, resize_pixmap
+
+class _FilenameTable(dict):
+    """str.translate table that replaces characters unsafe in file names.
+    
+    Entries are computed on first use, so only characters that actually
+    occur in quotes end up in the table.
+    """
+    
+    def __missing__(self, code_point: int) -> str:
+        char = chr(code_point)
+        safe = char if char.isalnum() or char in ' _-' else '_'
+        self[code_point] = safe
+        return safe
+
+_FILENAME_TABLE = _FilenameTable()
+
+class ThumbnailLoader(QRunnable):
+    """Thread pool task that decodes a background thumbnail."""
+    
+    class Signals(QObject):
+        """Signals emitted by the loader (QRunnable is not a QObject)."""
+        loaded = pyqtSignal(int, QImage)  # row, thumbnail (null on failure)
+    
+    def __init__(self, row: int, file_path: Path, size: int, cancelled: threading.Event):
+        """Initialize the loader.
+        
+        Args:
+            row: Row of the list item the thumbnail belongs to.
+            file_path: Path to the image file.
+            size: Maximum width and height of the thumbnail.
+            cancelled: Event set when the thumbnail is no longer needed.
+        """
+        super().__init__()
+        self.signals = ThumbnailLoader.Signals()
+        self.row = row
+        self.file_path = file_path
+        self.size = size
+        self._cancelled = cancelled
+    
+    def run(self) -> None:
+        """Decode the thumbnail and emit it."""
+        if self._cancelled.is_set():
+            return
+        
+        # Let the decoder produce the thumbnail size directly
+        # instead of decoding the full image and scaling it
+        reader = QImageReader(str(self.file_path))
+        thumb_size = reader.size()
+        if thumb_size.isValid():
+            thumb_size.scale(self.size, self.size, Qt.AspectRatioMode.KeepAspectRatio)
+            reader.setScaledSize(thumb_size)
+        image = reader.read()
+        
+        if image.isNull():
+            image = QImage(str(self.file_path))
+            if not image.isNull():
+                image = image.scaled(
+                    self.size, self.size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.FastTransformation
+                )
+        
+        if not self._cancelled.is_set():
+            self.signals.loaded.emit(self.row, image)
+
+class BgLoader(QRunnable):
+    """Thread pool task that decodes a full-size background image."""
+    
+    class Signals(QObject):
+        """Signals emitted by the loader (QRunnable is not a QObject)."""
+        loaded = pyqtSignal(str, QImage)  # file path, image (null on failure)
+    
+    def __init__(self, file_path: Path):
+        """Initialize the loader.
+        
+        Args:
+            file_path: Path to the image file.
+        """
+        super().__init__()
+        self.signals = BgLoader.Signals()
+        self.file_path = file_path
+    
+    def run(self) -> None:
+        """Decode the image and emit it."""
+        image = QImageReader(str(self.file_path)).read()
+        self.signals.loaded.emit(str(self.file_path), image)
+
+class BackgroundDialog(QDialog):
+    """Dialog for picking a background from the collection."""
+    
+    def __init__(self, image_files, parent=None):
+        """Initialize the dialog.
+        
+        Args:
+            image_files: Paths of the background images to offer.
+            parent: Parent widget.
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Select Background")
+        self.setMinimumSize(600, 400)
+        
+        layout = QVBoxLayout(self)
+        
+        # Create list widget for image selection
+        self.list_widget = QListWidget()
+        self.list_widget.setViewMode(QListWidget.ViewMode.IconMode)
+        self.list_widget.setIconSize(QSize(150, 150))
+        self.list_widget.setResizeMode(QListWidget.ResizeMode.Adjust)
+        self.list_widget.setSpacing(10)
+        
+        # Add images to the list; thumbnails that aren't cached yet
+        # are decoded in the background and filled in as they arrive
+        self._thumb_keys = {}
+        self._cancelled = threading.Event()
+        placeholder = QPixmap(150, 150)
+        placeholder.fill(QColor("#e0e0e0"))
+        
+        for row, img_file in enumerate(image_files):
+            # Reuse the thumbnail from a previous dialog if the file is unchanged
+            key = f"thumb:{img_file}:{img_file.stat().st_mtime_ns}"
+            thumb = find_cached_pixmap(key)
+            if thumb is None:
+                self._thumb_keys[row] = key
+                loader = ThumbnailLoader(row, img_file, 150, self._cancelled)
+                loader.signals.loaded.connect(self.on_thumbnail_loaded)
+                QThreadPool.globalInstance().start(loader)
+            
+            item = QListWidgetItem(img_file.name)
+            item.setIcon(QIcon(thumb if thumb is not None else placeholder))
+            item.setData(Qt.ItemDataRole.UserRole, img_file)
+            item.setToolTip(img_file.name)
+            self.list_widget.addItem(item)
+        
+        # Select the first item by default
+        if self.list_widget.count() > 0:
+            self.list_widget.setCurrentRow(0)
+        
+        # Add buttons
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | 
+            QDialogButtonBox.StandardButton.Cancel
+        )
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        
+        # Add widgets to layout
+        layout.addWidget(self.list_widget)
+        layout.addWidget(button_box)
+    
+    def on_thumbnail_loaded(self, row, image):
+        """Show a thumbnail decoded in the background."""
+        item = self.list_widget.item(row)
+        if item is None:
+            return
+        
+        # Hide files that couldn't be decoded
+        if image.isNull():
+            item.setHidden(True)
+            return
+        
+        thumb = QPixmap.fromImage(image)
+        QPixmapCache.insert(self._thumb_keys.pop(row), thumb)
+        item.setIcon(QIcon(thumb))
+    
+    def done(self, result):
+        """Stop pending thumbnail loads when the dialog closes."""
+        self._cancelled.set()
+        super().done(result)
+    
+    def selected_file(self):
+        """Get the selected file path."""
+        items = self.list_widget.selectedItems()
+        if items:
+            return items[0].data(Qt.ItemDataRole.UserRole)
+        return None
+
 class MainWindow(QMainWindow):
     """Main application window."""
     
@@ -26,6 +209,37 @@ class MainWindow(QMainWindow):
         self.text_x_position = 0  # Range: -100 to 100
         self.text_y_position = 0  # Range: -100 to 100
         
+        # Cached preview background layer (background scaled onto the canvas)
+        self._base_image = None
+        self._base_key = None
+        self._last_render_key = None
+        
+        # Current background smoothly pre-scaled to the preview size; held
+        # here so a QPixmapCache eviction can't force a rescale
+        self._preview_background = None
+        self._preview_background_key = None
+        
+        # Cached layout of the quote text
+        self._static_text = None
+        self._static_text_key = None
+        
+        # Coalesce bursts of preview updates (typing, slider drags) into one
+        # render per frame
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(16)
+        self._preview_timer.timeout.connect(self._do_update_preview)
+        
+        # Collection background currently being decoded off the UI thread
+        self._pending_background = None
+        
+        # Last quote text seen by the textChanged handler
+        self._last_text = None
+        
+        # AI generator, created on first use, and its progress dialog
+        self.ai_generator = None
+        self._ai_progress = None
+        
         # Window properties
         self.setWindowTitle("Quote Poster Generator")
         self.setMinimumSize(1000, 700)
@@ -95,7 +309,7 @@ class MainWindow(QMainWindow):
         
         self.text_edit = QTextEdit()
         self.text_edit.setPlaceholderText("Enter your quote here...")
-        self.text_edit.textChanged.connect(self.update_preview)
+        self.text_edit.textChanged.connect(self._on_text_changed)
         text_layout.addWidget(self.text_edit)
         
         # Text controls
@@ -216,7 +430,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.preview_label)
         
         # Set default preview
-        self.update_preview()
+        self._do_update_preview()
         
         return panel
     
@@ -248,18 +462,13 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Directory Not Found", error_msg)
                 return
             
-            # Get all image files in the directory (case-insensitive)
-            image_extensions = ['.jpg', '.jpeg', '.png', '.bmp']
-            image_files = []
-            
-            for ext in image_extensions:
-                # Search for both lowercase and uppercase extensions
-                image_files.extend(bg_dir.glob(f'*{ext}'))
-                if ext != ext.upper():
-                    image_files.extend(bg_dir.glob(f'*{ext.upper()}'))
-            
-            # Remove duplicates and sort
-            image_files = sorted(list(set(image_files)))
+            # Get all image files in the directory (case-insensitive) in a single pass
+            image_extensions = ('.jpg', '.jpeg', '.png', '.bmp')
+            with os.scandir(bg_dir) as entries:
+                image_files = sorted(
+                    Path(entry.path) for entry in entries
+                    if entry.is_file() and entry.name.lower().endswith(image_extensions)
+                )
             
             if not image_files:
                 error_msg = (
@@ -270,84 +479,18 @@ class MainWindow(QMainWindow):
                 print(error_msg)
                 QMessageBox.warning(self, "No Images Found", error_msg)
                 return
-            
-            if not image_files:
-                QMessageBox.warning(
-                    self, 
-                    "No Backgrounds", 
-                    "No background images found in the collection.\n\n"
-                    "Please add some images to the 'assets/backgrounds' directory."
-                )
-                return
                 
-            # Create a dialog to select from available backgrounds
-            from PyQt6.QtWidgets import QDialog, QVBoxLayout, QListWidget, QDialogButtonBox
-            
-            class BackgroundDialog(QDialog):
-                def __init__(self, image_files, parent=None):
-                    super().__init__(parent)
-                    self.setWindowTitle("Select Background")
-                    self.setMinimumSize(600, 400)
-                    
-                    layout = QVBoxLayout(self)
-                    
-                    # Create list widget for image selection
-                    self.list_widget = QListWidget()
-                    self.list_widget.setViewMode(QListWidget.ViewMode.IconMode)
-                    self.list_widget.setIconSize(QSize(150, 150))
-                    self.list_widget.setResizeMode(QListWidget.ResizeMode.Adjust)
-                    self.list_widget.setSpacing(10)
-                    
-                    # Add images to the list
-                    for img_file in image_files:
-                        pixmap = QPixmap(str(img_file))
-                        if not pixmap.isNull():
-                            # Create a thumbnail
-                            thumb = pixmap.scaled(
-                                150, 150, 
-                                Qt.AspectRatioMode.KeepAspectRatio,
-                                Qt.TransformationMode.SmoothTransformation
-                            )
-                            item = QListWidgetItem(img_file.name)
-                            item.setIcon(QIcon(thumb))
-                            item.setData(Qt.ItemDataRole.UserRole, img_file)
-                            item.setToolTip(img_file.name)
-                            self.list_widget.addItem(item)
-                    
-                    # Select the first item by default
-                    if self.list_widget.count() > 0:
-                        self.list_widget.setCurrentRow(0)
-                    
-                    # Add buttons
-                    button_box = QDialogButtonBox(
-                        QDialogButtonBox.StandardButton.Ok | 
-                        QDialogButtonBox.StandardButton.Cancel
-                    )
-                    button_box.accepted.connect(self.accept)
-                    button_box.rejected.connect(self.reject)
-                    
-                    # Add widgets to layout
-                    layout.addWidget(self.list_widget)
-                    layout.addWidget(button_box)
-                
-                def selected_file(self):
-                    """Get the selected file path."""
-                    items = self.list_widget.selectedItems()
-                    if items:
-                        return items[0].data(Qt.ItemDataRole.UserRole)
-                    return None
-            
             # Show the dialog
             dialog = BackgroundDialog(image_files, self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 selected_file = dialog.selected_file()
                 if selected_file:
-                    self.current_background = QPixmap(str(selected_file))
-                    if not self.current_background.isNull():
-                        self.update_preview()
-                        self.statusBar().showMessage(f"Loaded: {selected_file.name}")
-                    else:
-                        QMessageBox.warning(self, "Error", f"Failed to load image: {selected_file.name}")
+                    # Decode the (possibly large) image in the background
+                    self._pending_background = str(selected_file)
+                    self.statusBar().showMessage(f"Loading: {selected_file.name}")
+                    loader = BgLoader(selected_file)
+                    loader.signals.loaded.connect(self._on_background_loaded)
+                    QThreadPool.globalInstance().start(loader)
                         
         except Exception as e:
             QMessageBox.critical(
@@ -357,6 +500,26 @@ class MainWindow(QMainWindow):
                 f"Please make sure the 'assets/backgrounds' directory exists and contains valid images."
             )
     
+    def _on_background_loaded(self, file_path: str, image: QImage):
+        """Show a collection background decoded in the background.
+        
+        Args:
+            file_path: Path of the decoded image.
+            image: The decoded image (null on failure).
+        """
+        # Ignore results for a selection that has since been replaced
+        if file_path != self._pending_background:
+            return
+        self._pending_background = None
+        
+        name = Path(file_path).name
+        if image.isNull():
+            QMessageBox.warning(self, "Error", f"Failed to load image: {name}")
+            return
+        
+        self._set_background(QPixmap.fromImage(image))
+        self.statusBar().showMessage(f"Loaded: {name}")
+    
     def load_custom_background(self):
         """Load a custom background image."""
         file_name, _ = QFileDialog.getOpenFileName(
@@ -367,8 +530,8 @@ class MainWindow(QMainWindow):
         )
         
         if file_name:
-            self.current_background = QPixmap(file_name)
-            self.update_preview()
+            self._pending_background = None
+            self._set_background(QPixmap(file_name))
     
     def generate_background_ai(self):
         """Generate a background using AI."""
@@ -386,6 +549,23 @@ class MainWindow(QMainWindow):
         if not ok or not prompt.strip():
             return
             
+        # The generator runs requests on its own thread pool, so it's created
+        # once and reused instead of being wrapped in a new thread per request
+        if self.ai_generator is None:
+            from app.core.ai_generator import AIGenerator
+            self.ai_generator = AIGenerator()
+            self.ai_generator.progress_updated.connect(self._on_ai_progress_updated)
+            self.ai_generator.generation_finished.connect(self._on_ai_generation_finished)
+        
+        if not self.ai_generator.is_configured():
+            QMessageBox.warning(
+                self,
+                "Generation Failed",
+                "AI generation is not properly configured.\n"
+                "Please set up your API keys in the .env file."
+            )
+            return
+        
         # Create progress dialog
         progress = QProgressDialog(
             "Generating AI background...",
@@ -396,84 +576,51 @@ class MainWindow(QMainWindow):
         progress.setMinimumDuration(0)
         progress.setValue(0)
         
-        # Initialize AI generator
-        from app.core.ai_generator import AIGenerator, AIGenerationResult
-        
-        # Create a worker thread for the generation
-        class GenerationThread(QThread):
-            finished_signal = pyqtSignal(AIGenerationResult)
-            progress_signal = pyqtSignal(int)
-            
-            def __init__(self, prompt, size):
-                super().__init__()
-                self.prompt = prompt
-                self.size = size
-                self.ai_gen = AIGenerator()
-                self._is_cancelled = False
-            
-            def run(self):
-                try:
-                    if not self.ai_gen.is_configured():
-                        self.finished_signal.emit(AIGenerationResult(
-                            success=False,
-                            error="AI generation is not properly configured.\n"
-                                 "Please set up your API keys in the .env file."
-                        ))
-                        return
-                    
-                    # Connect progress signals
-                    self.ai_gen.progress_updated.connect(self.progress_signal.emit)
-                    
-                    # Create an event loop to wait for the generation to complete
-                    loop = QEventLoop()
-                    self.ai_gen.generation_finished.connect(loop.quit)
-                    
-                    # Start generation
-                    self.ai_gen.generate_background(self.prompt, self.size)
-                    
-                    # Show progress dialog
-                    self.progress_signal.emit(10)
-                    
-                    # Wait for generation to complete
-                    loop.exec()
-                    
-                except Exception as e:
-                    self.finished_signal.emit(AIGenerationResult(
-                        success=False,
-                        error=f"Error during generation: {str(e)}"
-                    ))
-        
-        # Create and start the worker thread
-        self.generation_thread = GenerationThread(prompt, (1024, 1024))
-        
-        # Connect signals
-        def on_progress_updated(value):
-            progress.setValue(value)
-            
-        def on_generation_finished(result):
-            progress.close()
-            
-            if result.success and result.image:
-                self.current_background = result.image
-                self.update_preview()
-                self.statusBar().showMessage("AI background generated successfully!")
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Generation Failed",
-                    f"Failed to generate background: {result.error or 'Unknown error'}\n\n"
-                    "Please check your API key and internet connection."
-                )
-        
-        # Connect signals
-        self.generation_thread.finished_signal.connect(on_generation_finished)
-        self.generation_thread.progress_signal.connect(on_progress_updated)
-        
-        # Cancel handling
-        progress.canceled.connect(self.generation_thread.terminate)
+        # Cancelling stops the request cooperatively; its result is discarded
+        self._ai_progress = progress
+        progress.canceled.connect(self._cancel_ai_generation)
+        progress.setValue(10)
         
-        # Start the generation
-        self.generation_thread.start()
+        # Start the generation; each click asks for a new image, so don't
+        # reuse one cached for the same prompt
+        self.ai_generator.generate_background(prompt, (1024, 1024), use_cache=False)
+    
+    def _cancel_ai_generation(self):
+        """Cancel the running AI generation."""
+        self._ai_progress = None
+        self.ai_generator.cancel_generation()
+    
+    def _on_ai_progress_updated(self, value):
+        """Show the progress of the AI generation."""
+        if self._ai_progress is not None:
+            self._ai_progress.setValue(value)
+    
+    def _on_ai_generation_finished(self, result):
+        """Use the generated background or report the failure."""
+        if self._ai_progress is not None:
+            self._ai_progress.close()
+            self._ai_progress = None
+        
+        if result.success and result.image:
+            self._pending_background = None
+            self._set_background(result.image)
+            self.statusBar().showMessage("AI background generated successfully!")
+        else:
+            QMessageBox.warning(
+                self,
+                "Generation Failed",
+                f"Failed to generate background: {result.error or 'Unknown error'}\n\n"
+                "Please check your API key and internet connection."
+            )
+    
+    def _on_text_changed(self):
+        """Refresh the preview only if the quote text actually changed."""
+        # textChanged also fires for formatting-only edits of the document
+        text = self.text_edit.toPlainText()
+        if text == self._last_text:
+            return
+        self._last_text = text
+        self.update_preview()
     
     def change_font_family(self, font_family):
         """Change the font family."""
@@ -511,73 +658,192 @@ class MainWindow(QMainWindow):
             self.text_y_position = self.v_slider.value()
             self.update_preview()
 
+    def _set_background(self, pixmap: QPixmap):
+        """Use a new background and refresh the preview.
+        
+        The background is scaled to the preview size once here, so preview
+        updates draw the scaled copy instead of the full-size original,
+        which is kept for export.
+        
+        Args:
+            pixmap: The new background.
+        """
+        self.current_background = pixmap
+        self._preview_background = None
+        self._preview_background_key = None
+        self._last_render_key = None
+        
+        preview_size = self.preview_label.size()
+        if not pixmap.isNull() and preview_size.width() > 0 and preview_size.height() > 0:
+            self._preview_scaled_background(preview_size)
+        
+        self.update_preview()
+    
+    def _preview_scaled_background(self, size: QSize) -> QPixmap:
+        """Get the current background smoothly scaled to cover the given size.
+        
+        Args:
+            size: The size the background has to cover.
+            
+        Returns:
+            QPixmap: The scaled background.
+        """
+        key = (self.current_background.cacheKey(), size.width(), size.height())
+        if key != self._preview_background_key:
+            self._preview_background = self._scaled_background(size)
+            self._preview_background_key = key
+        return self._preview_background
+    
+    def resizeEvent(self, event):
+        """Re-render the preview at the new size once resizing settles."""
+        super().resizeEvent(event)
+        # Cached layers are keyed on the preview size, so they refresh on their own
+        self._preview_timer.start()
+    
     def update_preview(self):
+        """Schedule a preview update, coalescing rapid successive requests."""
+        self._preview_timer.start()
+    
+    def _scaled_background(self, size: QSize) -> QPixmap:
+        """Get the current background scaled to cover the given size.
+        
+        Scaled backgrounds are kept in QPixmapCache, so updates that only
+        change the text reuse them instead of rescaling the image.
+        
+        Args:
+            size: The size the background has to cover.
+            
+        Returns:
+            QPixmap: The scaled background.
+        """
+        key = f"bg:{self.current_background.cacheKey()}:{size.width()}x{size.height()}"
+        scaled_bg = find_cached_pixmap(key)
+        if scaled_bg is None:
+            scaled_bg = resize_pixmap(
+                self.current_background,
+                size,
+                Qt.AspectRatioMode.KeepAspectRatioByExpanding
+            )
+            QPixmapCache.insert(key, scaled_bg)
+        return scaled_bg
+    
+    def _do_update_preview(self):
         """Update the preview with the current state."""
         if not hasattr(self, 'preview_label') or not hasattr(self, 'current_background') or not self.current_background:
             return
-            
+        
+        # Read the state once; this runs for every preview update
+        background = self.current_background
+        label = self.preview_label
+        font = self.current_font
+        color = self.text_color
+        alignment = self.alignment
+        x_position = self.text_x_position
+        y_position = self.text_y_position
+        
         try:
-            # Create a blank pixmap with the same size as the label
-            preview_size = self.preview_label.size()
-            if preview_size.width() <= 0 or preview_size.height() <= 0:
+            # Render at the same size as the label
+            preview_size = label.size()
+            width = preview_size.width()
+            height = preview_size.height()
+            if width <= 0 or height <= 0:
                 return
-                
-            # Create a pixmap to draw on
-            pixmap = QPixmap(preview_size)
-            pixmap.fill(Qt.GlobalColor.white)
             
-            # Draw the background
-            scaled_bg = self.current_background.scaled(
-                preview_size,
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
+            # Skip rendering when nothing visible changed since the last update
+            background_key = background.cacheKey()
+            text = self.text_edit.toPlainText()
+            font_key = font.toString()
+            render_key = (
+                background_key,
+                width,
+                height,
+                text,
+                font_key,
+                color.rgba(),
+                alignment,
+                x_position,
+                y_position
             )
+            if render_key == self._last_render_key:
+                return
+                
+            # Rebuild the background layer only when the background or size changed
+            base_key = (background_key, width, height)
+            if base_key != self._base_key:
+                # Paint into a premultiplied ARGB32 QImage, the raster engine's fastest target
+                base_image = QImage(preview_size, QImage.Format.Format_ARGB32_Premultiplied)
+                base_image.fill(Qt.GlobalColor.white)
+                
+                # Draw the background centered
+                scaled_bg = self._preview_scaled_background(preview_size)
+                x = (width - scaled_bg.width()) // 2
+                y = (height - scaled_bg.height()) // 2
+                
+                base_painter = QPainter(base_image)
+                base_painter.drawPixmap(x, y, scaled_bg)
+                base_painter.end()
+                self._base_image = base_image
+                self._base_key = base_key
             
-            # Center the background
-            x = (preview_size.width() - scaled_bg.width()) // 2
-            y = (preview_size.height() - scaled_bg.height()) // 2
-            
-            # Create a painter for the pixmap
-            painter = QPainter(pixmap)
-            painter.drawPixmap(x, y, scaled_bg)
+            # Draw the text layer on a copy of the background layer
+            image = QImage(self._base_image)
+            painter = QPainter(image)
             
             # Draw the text if available
-            if hasattr(self, 'text_edit') and hasattr(self, 'current_font') and hasattr(self, 'text_color'):
-                text = self.text_edit.toPlainText()
-                if text:
-                    # Configure text rendering
-                    painter.setFont(self.current_font)
-                    painter.setPen(self.text_color)
-                    
-                    # Set up text rectangle with margins
-                    margin = 40
-                    text_rect = pixmap.rect().adjusted(margin, margin, -margin, -margin)
-                    
-                    # Calculate position offset based on slider values (-100 to 100)
-                    text_width = text_rect.width()
-                    text_height = text_rect.height()
-                    
-                    # Calculate position offset based on slider values
-                    x_offset = int((self.text_x_position / 100.0) * (text_width / 2))
-                    y_offset = int((self.text_y_position / 100.0) * (text_height / 2))
-                    
-                    # Adjust text rectangle based on horizontal position
-                    if self.alignment & Qt.AlignmentFlag.AlignLeft:
-                        text_rect.adjust(x_offset, 0, x_offset, 0)
-                    elif self.alignment & Qt.AlignmentFlag.AlignRight:
-                        text_rect.adjust(-x_offset, 0, -x_offset, 0)
-                    else:  # Center alignment (default)
-                        text_rect.adjust(x_offset, 0, x_offset, 0)
-                    
-                    # Apply vertical offset
-                    text_rect.adjust(0, y_offset, 0, y_offset)
+            if text:
+                # Configure text rendering
+                painter.setFont(font)
+                painter.setPen(color)
+                
+                # Set up text rectangle with margins
+                margin = 40
+                text_rect = image.rect().adjusted(margin, margin, -margin, -margin)
+                
+                # Calculate position offset based on slider values (-100 to 100)
+                text_width = text_rect.width()
+                text_height = text_rect.height()
+                
+                # Calculate position offset based on slider values
+                x_offset = int((x_position / 100.0) * (text_width / 2))
+                y_offset = int((y_position / 100.0) * (text_height / 2))
+                
+                # Adjust text rectangle based on horizontal position
+                if alignment & Qt.AlignmentFlag.AlignLeft:
+                    text_rect.adjust(x_offset, 0, x_offset, 0)
+                elif alignment & Qt.AlignmentFlag.AlignRight:
+                    text_rect.adjust(-x_offset, 0, -x_offset, 0)
+                else:  # Center alignment (default)
+                    text_rect.adjust(x_offset, 0, x_offset, 0)
+                
+                # Apply vertical offset
+                text_rect.adjust(0, y_offset, 0, y_offset)
+                
+                # QStaticText ignores '\n'; use QChar::LineSeparator like drawText does
+                layout_text = text.replace('\n', '\u2028')
+                
+                # Reuse the laid-out text unless the text, font, alignment or width changed
+                static_key = (layout_text, font_key, alignment, text_width)
+                static_text = self._static_text
+                if static_key != self._static_text_key:
+                    option = QTextOption(alignment & Qt.AlignmentFlag.AlignHorizontal_Mask)
+                    option.setWrapMode(QTextOption.WrapMode.WordWrap)
                     
-                    # Draw the text with word wrap and alignment
-                    painter.drawText(
-                        text_rect,
-                        self.alignment | Qt.TextFlag.TextWordWrap,
-                        text
-                    )
+                    static_text = QStaticText(layout_text)
+                    static_text.setTextFormat(Qt.TextFormat.PlainText)
+                    static_text.setTextOption(option)
+                    static_text.setTextWidth(text_width)
+                    static_text.prepare(QTransform(), font)
+                    self._static_text = static_text
+                    self._static_text_key = static_key
+                
+                # Draw the text, centering it vertically for center alignment
+                y = text_rect.top()
+                if alignment & Qt.AlignmentFlag.AlignVCenter:
+                    y += (text_height - static_text.size().height()) / 2
+                
+                # drawStaticText doesn't clip like drawText(rect, ...) did
+                painter.setClipRect(text_rect)
+                painter.drawStaticText(QPointF(text_rect.left(), y), static_text)
                     
         except Exception as e:
             print(f"Error updating preview: {e}")
@@ -587,8 +853,9 @@ class MainWindow(QMainWindow):
             if 'painter' in locals() and painter.isActive():
                 painter.end()
         
-        # Update the preview
-        self.preview_label.setPixmap(pixmap)
+        # Update the preview, converting to a QPixmap once at the end
+        label.setPixmap(QPixmap.fromImage(image))
+        self._last_render_key = render_key
     
     def export_poster(self):
         """Export the current poster as an image file."""
@@ -600,8 +867,8 @@ class MainWindow(QMainWindow):
                 
             # Get the text to include in the filename
             text = self.text_edit.toPlainText() if hasattr(self, 'text_edit') else "poster"
-            safe_text = "".join([c if c.isalnum() or c in ' _-' else '_' for c in text])
-            default_name = f"{safe_text[:30]}_poster.png"
+            safe_text = text[:30].translate(_FILENAME_TABLE)
+            default_name = f"{safe_text}_poster.png"
             
             # Open file dialog to choose save location
             file_name, selected_filter = QFileDialog.getSaveFileName(
@@ -624,13 +891,24 @@ class MainWindow(QMainWindow):
                     file_name += '.jpg'
                 format = 'JPEG'
             
-            # Get the current preview pixmap
+            # Render any pending changes, then get the current preview pixmap
+            self._preview_timer.stop()
+            self._do_update_preview()
             pixmap = self.preview_label.pixmap()
             if not pixmap or pixmap.isNull():
                 raise ValueError("No preview available to save")
             
             # Save the pixmap to file
-            success = pixmap.save(file_name, format, quality=95 if format == 'JPEG' else -1)
+            if format == 'JPEG':
+                # QImageWriter exposes optimized Huffman tables and progressive
+                # scans, which give smaller files at the same quality
+                writer = QImageWriter(file_name, b'JPEG')
+                writer.setQuality(95)
+                writer.setOptimizedWrite(True)
+                writer.setProgressiveScanWrite(True)
+                success = writer.write(pixmap.toImage())
+            else:
+                success = pixmap.save(file_name, format)
             
             if success:
                 self.statusBar().showMessage(f"Poster saved to {file_name}", 5000)
@@ -3,10 +3,23 @@ Configuration management for the Quote Poster Generator.
 """
 import json
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
-from PyQt6.QtCore import QSettings, QStandardPaths
+from PyQt6.QtCore import QSettings, QStandardPaths, QByteArray, QTimer, QCoreApplication
+
+# Use the much faster orjson encoder/decoder when it is installed
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
 
 class ConfigManager:
     """Manages application configuration and settings."""
@@ -21,38 +34,81 @@ class ConfigManager:
         self.settings = QSettings("MQPG", app_name)
         self.app_data_dir = self._get_app_data_dir()
         self.config_file = os.path.join(self.app_data_dir, 'config.json')
+        # Recent files change often, so they are kept in their own small file
+        self.recent_file = os.path.join(self.app_data_dir, 'recent.json')
         self.default_settings = {
-            'recent_files': [],
             'max_recent_files': 10,
             'default_save_dir': str(Path.home() / 'Pictures' / 'QuotePosters'),
             'default_font': 'Arial',
             'default_font_size': 24,
             'default_text_color': '#FFFFFF',
             'default_bg_color': '#333333',
-            'window_geometry': None,
-            'window_state': None,
         }
-        self._ensure_config_file_exists()
+        
+        # Parsed configuration and recent files, read on first use
+        self._cfg: Optional[Dict[str, Any]] = None
+        self._recent: Optional[OrderedDict] = None
+        
+        # Changes are written in batches by flush()
+        self._dirty = False
+        self._recent_dirty = False
+        self._flush_pending = False
     
     def _get_app_data_dir(self) -> str:
-        """Get the application data directory, creating it if it doesn't exist.
+        """Get the application data directory.
+        
+        The directory is created when the configuration is first saved.
         
         Returns:
             str: Path to the application data directory.
         """
-        app_data = QStandardPaths.writableLocation(
+        return QStandardPaths.writableLocation(
             QStandardPaths.StandardLocation.AppDataLocation
         )
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """The configuration, loaded from file on first access."""
+        if self._cfg is None:
+            self._cfg = self._load_config()
+        return self._cfg
+    
+    @property
+    def recent(self) -> OrderedDict:
+        """Recent files, oldest first, so adding and evicting entries is O(1)."""
+        if self._recent is None:
+            self._recent = OrderedDict.fromkeys(reversed(self._load_recent_files()))
+        return self._recent
+    
+    def _read_json(self, file_path: str) -> Any:
+        """Read a JSON file.
         
-        if not os.path.exists(app_data):
-            os.makedirs(app_data, exist_ok=True)
-        
-        return app_data
+        Args:
+            file_path: Path to the file.
+            
+        Returns:
+            Any: The parsed contents.
+        """
+        with open(file_path, 'rb') as f:
+            return _json_loads(f.read())
     
-    def _ensure_config_file_exists(self) -> None:
-        """Ensure the config file exists with default values if it doesn't."""
-        if not os.path.exists(self.config_file):
-            self._save_config(self.default_settings)
+    def _write_json(self, file_path: str, data: Any) -> None:
+        """Write a JSON file atomically.
+        
+        The data is written to a temporary file first and then moved into
+        place, so a crash mid-write can't leave a truncated file behind.
+        
+        Args:
+            file_path: Path to the file.
+            data: The data to write.
+        """
+        tmp_file = file_path + '.tmp'
+        os.makedirs(self.app_data_dir, exist_ok=True)
+        with open(tmp_file, 'wb', buffering=1 << 16) as f:
+            f.write(_json_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, file_path)
     
     def _load_config(self) -> Dict[str, Any]:
         """Load the configuration from file.
@@ -61,8 +117,7 @@ class ConfigManager:
             Dict[str, Any]: The loaded configuration.
         """
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = self._read_json(self.config_file)
             
             # Merge with default settings to ensure all keys exist
             merged = {**self.default_settings, **config}
@@ -77,11 +132,39 @@ class ConfigManager:
             config: The configuration to save.
         """
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4)
+            self._write_json(self.config_file, config)
         except (IOError, TypeError) as e:
             print(f"Error saving config: {e}")
     
+    def _load_recent_files(self) -> list:
+        """Load the recent files list from its file.
+        
+        Lists stored in config.json by earlier versions are moved over.
+        
+        Returns:
+            list: List of recent file paths, most recent first.
+        """
+        try:
+            recent_files = self._read_json(self.recent_file)
+        except FileNotFoundError:
+            recent_files = self.config.pop('recent_files', None)
+            if recent_files is None:
+                return []
+            # Written to recent.json and dropped from config.json on the next flush
+            self._dirty = True
+            self._recent_dirty = True
+        except json.JSONDecodeError:
+            return []
+        
+        return recent_files if isinstance(recent_files, list) else []
+    
+    def _save_recent_files(self) -> None:
+        """Save the recent files list to its file."""
+        try:
+            self._write_json(self.recent_file, self.get_recent_files())
+        except (IOError, TypeError) as e:
+            print(f"Error saving recent files: {e}")
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value.
         
@@ -92,8 +175,9 @@ class ConfigManager:
         Returns:
             The configuration value, or the default if not found.
         """
-        config = self._load_config()
-        return config.get(key, default)
+        if key == 'recent_files':
+            return self.get_recent_files()
+        return self.config.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value.
@@ -102,9 +186,32 @@ class ConfigManager:
             key: The configuration key.
             value: The value to set.
         """
-        config = self._load_config()
-        config[key] = value
-        self._save_config(config)
+        if key == 'recent_files':
+            self._recent = OrderedDict.fromkeys(reversed(value))
+            self._recent_dirty = True
+        else:
+            self.config[key] = value
+            self._dirty = True
+        self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        """Schedule a write of the pending changes."""
+        # Coalesce changes made in quick succession into a single write
+        if QCoreApplication.instance() is None:
+            self.flush()
+        elif not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(500, self.flush)
+    
+    def flush(self) -> None:
+        """Write pending configuration changes to disk."""
+        self._flush_pending = False
+        if self._dirty:
+            self._dirty = False
+            self._save_config(self.config)
+        if self._recent_dirty:
+            self._recent_dirty = False
+            self._save_recent_files()
     
     def add_recent_file(self, file_path: str) -> None:
         """Add a file to the recent files list.
@@ -112,62 +219,56 @@ class ConfigManager:
         Args:
             file_path: Path to the file to add.
         """
-        recent_files = self.get('recent_files', [])
-        
-        # Remove if already exists
-        if file_path in recent_files:
-            recent_files.remove(file_path)
+        # Work on one snapshot of the loaded state for the whole update
+        recent = self.recent
+        max_files = self.config.get('max_recent_files', 10)
         
-        # Add to the beginning
-        recent_files.insert(0, file_path)
+        # Move the file to the most recent end
+        recent.pop(file_path, None)
+        recent[file_path] = None
         
-        # Trim the list if it's too long
-        max_files = self.get('max_recent_files', 10)
-        if len(recent_files) > max_files:
-            recent_files = recent_files[:max_files]
+        # Drop the oldest entries if the list is too long
+        while len(recent) > max_files:
+            recent.popitem(last=False)
         
-        self.set('recent_files', recent_files)
+        self._recent_dirty = True
+        self._schedule_flush()
     
     def get_recent_files(self) -> list:
         """Get the list of recent files.
         
         Returns:
-            list: List of recent file paths.
+            list: List of recent file paths, most recent first.
         """
-        return self.get('recent_files', [])
+        return list(reversed(self.recent))
     
     def clear_recent_files(self) -> None:
         """Clear the recent files list."""
-        self.set('recent_files', [])
+        self.recent.clear()
+        self._recent_dirty = True
+        self._schedule_flush()
     
-    def save_window_geometry(self, geometry: bytes, state: bytes) -> None:
+    def save_window_geometry(self, geometry: QByteArray, state: QByteArray) -> None:
         """Save the main window geometry and state.
         
         Args:
-            geometry: The window geometry as bytes.
-            state: The window state as bytes.
-        """
-        self.set('window_geometry', geometry.hex())
-        self.set('window_state', state.hex())
-    
-    def load_window_geometry(self) -> Optional[bytes]:
-        """Load the saved window geometry.
-        
-        Returns:
-            Optional[bytes]: The window geometry as bytes, or None if not found.
+            geometry: The window geometry.
+            state: The window state.
         """
-        geometry_hex = self.get('window_geometry')
-        if geometry_hex:
-            return bytes.fromhex(geometry_hex)
-        return None
+        self.settings.beginGroup("window")
+        self.settings.setValue("geometry", geometry)
+        self.settings.setValue("state", state)
+        self.settings.endGroup()
     
-    def load_window_state(self) -> Optional[bytes]:
-        """Load the saved window state.
+    def load_window(self) -> Tuple[Optional[QByteArray], Optional[QByteArray]]:
+        """Load the saved window geometry and state in a single pass.
         
         Returns:
-            Optional[bytes]: The window state as bytes, or None if not found.
+            Tuple[Optional[QByteArray], Optional[QByteArray]]: The window geometry
+            and state, each None if not found.
         """
-        state_hex = self.get('window_state')
-        if state_hex:
-            return bytes.fromhex(state_hex)
-        return None
+        self.settings.beginGroup("window")
+        geometry = self.settings.value("geometry")
+        state = self.settings.value("state")
+        self.settings.endGroup()
+        return geometry, state
@@ -3,23 +3,42 @@ File utility functions for the Quote Poster Generator.
 """
 import os
 import shutil
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Set, Tuple
 
 from PyQt6.QtGui import QPixmap, QImage
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QSize
+
+from .image_utils import read_image
+
+# Supported image extensions, plus a set for O(1) lookups
+_SUPPORTED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+_IMG_EXTS = frozenset(_SUPPORTED_EXTENSIONS)
+
+# Absolute paths of directories already created or found to exist
+_ENSURED_DIRS: Set[str] = set()
 
 def ensure_directory_exists(directory: str) -> bool:
     """Ensure that a directory exists, creating it if necessary.
     
+    Directories are only checked once per session; later calls for the
+    same directory return without touching the file system.
+    
     Args:
         directory: Path to the directory.
         
     Returns:
         bool: True if the directory exists or was created, False otherwise.
     """
+    directory = os.path.abspath(directory)
+    if directory in _ENSURED_DIRS:
+        return True
+    
     try:
         Path(directory).mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
         return True
     except (OSError, Exception) as e:
         print(f"Error creating directory {directory}: {e}")
@@ -31,7 +50,7 @@ def get_supported_image_extensions() -> List[str]:
     Returns:
         List[str]: List of supported extensions (with leading dots).
     """
-    return ['.png', '.jpg', '.jpeg', '.bmp', '.gif']
+    return list(_SUPPORTED_EXTENSIONS)
 
 def is_supported_image_file(file_path: str) -> bool:
     """Check if a file has a supported image extension.
@@ -42,7 +61,7 @@ def is_supported_image_file(file_path: str) -> bool:
     Returns:
         bool: True if the file has a supported image extension.
     """
-    return any(file_path.lower().endswith(ext) for ext in get_supported_image_extensions())
+    return os.path.splitext(file_path)[1].lower() in _IMG_EXTS
 
 def get_image_files(directory: str) -> List[str]:
     """Get a list of image files in a directory.
@@ -56,14 +75,38 @@ def get_image_files(directory: str) -> List[str]:
     if not os.path.isdir(directory):
         return []
     
-    return [
-        os.path.join(directory, f) for f in os.listdir(directory)
-        if is_supported_image_file(f) and os.path.isfile(os.path.join(directory, f))
-    ]
+    # scandir entries know their type, so no extra stat per file is needed
+    with os.scandir(directory) as entries:
+        return [
+            entry.path for entry in entries
+            if is_supported_image_file(entry.name) and entry.is_file()
+        ]
+
+@lru_cache(maxsize=32)
+def _decode(file_path: str, mtime_ns: int, width: int, height: int) -> QPixmap:
+    """Decode an image file, optionally resizing it.
+    
+    The modification time is part of the cache key, so a changed file is
+    decoded again instead of being served from the cache.
+    
+    Args:
+        file_path: Absolute path to the image file.
+        mtime_ns: Modification time of the file in nanoseconds.
+        width: Width to resize the image to, or 0 to keep the original size.
+        height: Height to resize the image to, or 0 to keep the original size.
+        
+    Returns:
+        QPixmap: The decoded pixmap (null if decoding failed).
+    """
+    image = read_image(file_path, QSize(width, height) if width and height else None)
+    return QPixmap.fromImage(image) if not image.isNull() else QPixmap()
 
 def load_pixmap(file_path: str, size: Optional[Tuple[int, int]] = None) -> Optional[QPixmap]:
     """Load a QPixmap from a file, optionally resizing it.
     
+    Recently loaded images are cached, so loading an unchanged file again
+    doesn't decode it again.
+    
     Args:
         file_path: Path to the image file.
         size: Optional (width, height) to resize the image to.
@@ -71,56 +114,24 @@ def load_pixmap(file_path: str, size: Optional[Tuple[int, int]] = None) -> Optio
     Returns:
         Optional[QPixmap]: The loaded pixmap, or None if loading failed.
     """
-    if not os.path.isfile(file_path) or not is_supported_image_file(file_path):
+    if not is_supported_image_file(file_path):
         return None
     
-    pixmap = QPixmap(file_path)
-    
-    if pixmap.isNull():
+    try:
+        st = os.stat(file_path)
+    except OSError:
         return None
     
-    if size is not None:
-        pixmap = pixmap.scaled(
-            size[0], size[1],
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+    if not stat.S_ISREG(st.st_mode):
+        return None
     
-    return pixmap
-
-def save_pixmap(pixmap: QPixmap, file_path: str, quality: int = 90) -> bool:
-    """Save a QPixmap to a file.
+    pixmap = _decode(os.path.abspath(file_path), st.st_mtime_ns, *(size or (0, 0)))
     
-    Args:
-        pixmap: The pixmap to save.
-        file_path: Path where to save the file.
-        quality: Quality for JPEG compression (1-100).
-        
-    Returns:
-        bool: True if the save was successful, False otherwise.
-    """
     if pixmap.isNull():
-        return False
+        return None
     
-    try:
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
-        
-        # Determine format from file extension
-        ext = os.path.splitext(file_path)[1].lower()
-        
-        if ext in ['.jpg', '.jpeg']:
-            format = 'JPEG'
-            quality = max(1, min(100, quality))  # Ensure quality is between 1-100
-            return pixmap.save(file_path, format, quality=quality)
-        else:
-            # Default to PNG for other formats
-            if ext != '.png':
-                file_path = os.path.splitext(file_path)[0] + '.png'
-            return pixmap.save(file_path, 'PNG')
-    except Exception as e:
-        print(f"Error saving image to {file_path}: {e}")
-        return False
+    # Hand out a copy so callers painting on it can't alter the cached pixmap
+    return QPixmap(pixmap)
 
 def copy_file(src: str, dst: str) -> bool:
     """Copy a file from src to dst, creating directories if needed.
@@ -133,7 +144,8 @@ def copy_file(src: str, dst: str) -> bool:
         bool: True if the copy was successful, False otherwise.
     """
     try:
-        os.makedirs(os.path.dirname(os.path.abspath(dst)), exist_ok=True)
+        if not ensure_directory_exists(os.path.dirname(os.path.abspath(dst))):
+            return False
         shutil.copy2(src, dst)
         return True
     except Exception as e:
@@ -4,12 +4,69 @@ Image processing utilities for the Quote Poster Generator.
 from typing import Optional, Tuple, Union
 from pathlib import Path
 
-from PyQt6.QtGui import QPixmap, QImage, QPainter, QColor, QFont, QFontMetrics
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QPainter, QColor, QFont, QFontMetrics
 from PyQt6.QtCore import Qt, QRect, QSize
 
+# Image format used by save_pixmap for each file extension
+_FMT = {
+    '.jpg': 'JPEG',
+    '.jpeg': 'JPEG',
+    '.png': 'PNG',
+    '.bmp': 'BMP',
+}
+
+def find_cached_pixmap(key: str) -> Optional[QPixmap]:
+    """Look up a pixmap in Qt's global QPixmapCache.
+    
+    Args:
+        key: The cache key.
+        
+    Returns:
+        Optional[QPixmap]: The cached pixmap, or None if it isn't cached.
+    """
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        return None
+    return pixmap
+
+def read_image(file_path: Union[str, Path], size: Optional[QSize] = None) -> QImage:
+    """Decode an image file, optionally fitting it into a size.
+    
+    When a size is given the decoder produces the scaled image directly
+    (JPEG can decode at 1/2, 1/4 or 1/8 scale), instead of decoding the
+    full-resolution image and scaling it afterwards. EXIF orientation is
+    applied.
+    
+    Args:
+        file_path: Path to the image file.
+        size: Optional size to fit the image into, keeping its aspect ratio.
+        
+    Returns:
+        QImage: The decoded image (null if decoding failed).
+    """
+    reader = QImageReader(str(file_path))
+    reader.setAutoTransform(True)
+    
+    if size is not None:
+        source_size = reader.size()
+        if source_size.isValid():
+            reader.setScaledSize(source_size.scaled(size, Qt.AspectRatioMode.KeepAspectRatio))
+            return reader.read()
+    
+    image = reader.read()
+    if size is not None and not image.isNull():
+        # The format doesn't report its size up front; scale after decoding
+        image = image.scaled(
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+    return image
+
 def resize_pixmap(pixmap: QPixmap, size: QSize, 
                  aspect_ratio_mode: Qt.AspectRatioMode = Qt.AspectRatioMode.KeepAspectRatio,
-                 transform_mode: Qt.TransformationMode = Qt.TransformationMode.SmoothTransformation) -> QPixmap:
+                 transform_mode: Qt.TransformationMode = Qt.TransformationMode.SmoothTransformation,
+                 fast: bool = False) -> QPixmap:
     """Resize a QPixmap while maintaining aspect ratio.
     
     Args:
@@ -17,6 +74,8 @@ def resize_pixmap(pixmap: QPixmap, size: QSize,
         size: The target size (width, height).
         aspect_ratio_mode: How to handle aspect ratio.
         transform_mode: The transformation mode.
+        fast: Use the much cheaper FastTransformation regardless of
+            transform_mode, e.g. for previews during interaction.
         
     Returns:
         QPixmap: The resized pixmap.
@@ -24,6 +83,9 @@ def resize_pixmap(pixmap: QPixmap, size: QSize,
     if pixmap.isNull():
         return pixmap
     
+    if fast:
+        transform_mode = Qt.TransformationMode.FastTransformation
+    
     return pixmap.scaled(size, aspect_ratio_mode, transform_mode)
 
 def add_text_to_image(pixmap: QPixmap, text: str, 
@@ -126,23 +188,15 @@ def calculate_text_rect(text: str,
     if not text.strip():
         return QRect(0, 0, 0, 0)
     
-    # Create a temporary pixmap to calculate text metrics
-    temp_pixmap = QPixmap(1, 1)
-    painter = QPainter(temp_pixmap)
-    try:
-        painter.setFont(font)
-        metrics = painter.fontMetrics()
-        
-        # Calculate the bounding rectangle for the text with word wrap
-        rect = metrics.boundingRect(
-            0, 0, max_width, max_height,
-            Qt.TextFlag.TextWordWrap | Qt.AlignmentFlag.AlignLeft,
-            text
-        )
-    finally:
-        painter.end()
+    # Font metrics don't need a paint device, so query them directly
+    metrics = QFontMetrics(font)
     
-    return rect
+    # Calculate the bounding rectangle for the text with word wrap
+    return metrics.boundingRect(
+        0, 0, max_width, max_height,
+        Qt.TextFlag.TextWordWrap | Qt.AlignmentFlag.AlignLeft,
+        text
+    )
 
 def load_pixmap_from_file(file_path: Union[str, Path], 
                          size: Optional[QSize] = None) -> Optional[QPixmap]:
@@ -160,15 +214,12 @@ def load_pixmap_from_file(file_path: Union[str, Path],
     if not Path(file_path).exists():
         return None
     
-    pixmap = QPixmap(file_path)
+    image = read_image(file_path, size)
     
-    if pixmap.isNull():
+    if image.isNull():
         return None
     
-    if size is not None:
-        return resize_pixmap(pixmap, size)
-    
-    return pixmap
+    return QPixmap.fromImage(image)
 
 def save_pixmap(pixmap: QPixmap, 
                file_path: Union[str, Path], 
@@ -189,21 +240,22 @@ def save_pixmap(pixmap: QPixmap,
     file_path = str(file_path)
     
     try:
-        # Ensure the directory exists
-        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        # Ensure the directory exists (imported here, file_utils imports this module)
+        from .file_utils import ensure_directory_exists
+        if not ensure_directory_exists(str(Path(file_path).parent)):
+            return False
         
         # Determine format from file extension
-        ext = Path(file_path).suffix.lower()
+        format = _FMT.get(Path(file_path).suffix.lower())
+        if format is None:
+            # Default to PNG for other formats
+            format = 'PNG'
+            file_path = str(Path(file_path).with_suffix('.png'))
         
-        if ext in ['.jpg', '.jpeg']:
-            format = 'JPEG'
+        if format == 'JPEG':
             quality = max(1, min(100, quality))  # Ensure quality is between 1-100
             return pixmap.save(file_path, format, quality=quality)
-        else:
-            # Default to PNG for other formats
-            if ext != '.png':
-                file_path = str(Path(file_path).with_suffix('.png'))
-            return pixmap.save(file_path, 'PNG')
+        return pixmap.save(file_path, format)
     except Exception as e:
         print(f"Error saving image to {file_path}: {e}")
         return False
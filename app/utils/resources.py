@@ -3,12 +3,39 @@ Resource management for the Quote Poster Generator.
 """
 import os
 import sys
+from collections import OrderedDict, deque
+from functools import lru_cache, partial
 import importlib.resources as pkg_resources
 from pathlib import Path
 from typing import Optional, Union, List, Dict, Any
 
-from PyQt6.QtGui import QPixmap, QIcon, QFontDatabase, QFont
-from PyQt6.QtCore import QFile, QIODevice, QByteArray
+from PyQt6.QtGui import QPixmap, QPixmapCache, QIcon, QFontDatabase, QFont
+from PyQt6.QtCore import QFile, QIODevice, QByteArray, QTimer, QSize
+
+from .file_utils import ensure_directory_exists
+from .image_utils import find_cached_pixmap
+
+# Image extensions listed as backgrounds
+_BACKGROUND_EXTS = frozenset(('.png', '.jpg', '.jpeg', '.bmp'))
+
+# Maximum number of icons kept in the resource cache
+_RESOURCE_CACHE_SIZE = 64
+
+# Font files picked up by preload_fonts_async
+_FONT_EXTS = frozenset(('.ttf', '.otf'))
+
+@lru_cache(maxsize=16)
+def _read_style(path: str, mtime_ns: int) -> str:
+    """Read a style sheet, cached per file version.
+    
+    Args:
+        path: Path to the style sheet file.
+        mtime_ns: Modification time of the file in nanoseconds.
+        
+    Returns:
+        str: The contents of the style sheet.
+    """
+    return Path(path).read_text(encoding='utf-8')
 
 class ResourceManager:
     """Manages application resources like images, icons, and fonts."""
@@ -28,12 +55,14 @@ class ResourceManager:
             'styles': self.app_root / 'assets' / 'styles'
         }
         
-        # Ensure resource directories exist
-        self._ensure_resource_dirs()
+        # Resource directories are not created here: lookups handle missing
+        # directories, and creating them would litter the source tree or the
+        # current working directory on every launch
         
-        # Loaded resources cache
-        self._resource_cache = {}
+        # Loaded resources cache, least recently used first
+        self._resource_cache = OrderedDict()
         self._loaded_fonts = set()
+        self._pending_fonts = deque()
     
     def _find_app_root(self) -> Path:
         """Find the application root directory.
@@ -52,7 +81,33 @@ class ResourceManager:
     def _ensure_resource_dirs(self) -> None:
         """Ensure all resource directories exist."""
         for dir_path in self.resource_dirs.values():
-            dir_path.mkdir(parents=True, exist_ok=True)
+            ensure_directory_exists(str(dir_path))
+    
+    def _cache_get(self, key: str) -> Optional[Union[QPixmap, QIcon]]:
+        """Get a cached resource, marking it as recently used.
+        
+        Args:
+            key: The cache key.
+            
+        Returns:
+            Optional[Union[QPixmap, QIcon]]: The cached resource, or None if not cached.
+        """
+        resource = self._resource_cache.get(key)
+        if resource is not None:
+            self._resource_cache.move_to_end(key)
+        return resource
+    
+    def _cache_put(self, key: str, resource: Union[QPixmap, QIcon]) -> None:
+        """Cache a resource, evicting the least recently used one if full.
+        
+        Args:
+            key: The cache key.
+            resource: The resource to cache.
+        """
+        self._resource_cache[key] = resource
+        self._resource_cache.move_to_end(key)
+        if len(self._resource_cache) > _RESOURCE_CACHE_SIZE:
+            self._resource_cache.popitem(last=False)
     
     def get_path(self, resource_type: str, *path_parts: str) -> Path:
         """Get the path to a resource.
@@ -75,6 +130,9 @@ class ResourceManager:
     def load_pixmap(self, resource_type: str, *path_parts: str) -> Optional[QPixmap]:
         """Load a pixmap from resources.
         
+        Pixmaps are cached in Qt's global QPixmapCache, which is shared with
+        the rest of the application and bounded by its cache limit.
+        
         Args:
             resource_type: Type of resource ('images', 'backgrounds').
             *path_parts: Path components to the resource.
@@ -85,8 +143,9 @@ class ResourceManager:
         cache_key = f"pixmap:{resource_type}:{'/'.join(path_parts)}"
         
         # Check cache first
-        if cache_key in self._resource_cache:
-            return self._resource_cache[cache_key]
+        cached = find_cached_pixmap(cache_key)
+        if cached is not None:
+            return cached
         
         # Load the pixmap
         file_path = self.get_path(resource_type, *path_parts)
@@ -95,7 +154,7 @@ class ResourceManager:
             
         pixmap = QPixmap(str(file_path))
         if not pixmap.isNull():
-            self._resource_cache[cache_key] = pixmap
+            QPixmapCache.insert(cache_key, pixmap)
             return pixmap
             
         return None
@@ -113,26 +172,22 @@ class ResourceManager:
         cache_key = f"icon:{'/'.join(path_parts)}:{size if size else ''}"
         
         # Check cache first
-        if cache_key in self._resource_cache:
-            return self._resource_cache[cache_key]
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
         
         # Load the icon
         file_path = self.get_path('icons', *path_parts)
         if not file_path.exists():
             return None
             
-        if size:
-            pixmap = QPixmap(str(file_path)).scaled(
-                size, size, 
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            icon = QIcon(pixmap)
-        else:
-            icon = QIcon(str(file_path))
+        # Let QIcon load the file lazily at the size it's drawn at instead
+        # of decoding and scaling the full image up front
+        icon = QIcon()
+        icon.addFile(str(file_path), QSize(size, size) if size else QSize())
             
         if not icon.isNull():
-            self._resource_cache[cache_key] = icon
+            self._cache_put(cache_key, icon)
             return icon
             
         return None
@@ -160,6 +215,48 @@ class ResourceManager:
             
         return False
     
+    def preload_fonts_async(self, font_files: Optional[List[str]] = None, chunk_size: int = 2) -> None:
+        """Load fonts a few at a time from the event loop.
+        
+        QFontDatabase must be used from the GUI thread, so instead of a worker
+        thread the fonts are registered in small chunks between events,
+        keeping the UI responsive while they load.
+        
+        Args:
+            font_files: Font file names in the fonts directory. Defaults to
+                all .ttf and .otf files there.
+            chunk_size: Number of fonts to load per event loop iteration.
+        """
+        if font_files is None:
+            fonts_dir = self.resource_dirs['fonts']
+            if not fonts_dir.is_dir():
+                return
+            with os.scandir(fonts_dir) as entries:
+                font_files = [
+                    entry.name for entry in entries
+                    if os.path.splitext(entry.name)[1].lower() in _FONT_EXTS and entry.is_file()
+                ]
+        
+        # Only schedule a new chunk if none is pending already
+        idle = not self._pending_fonts
+        self._pending_fonts.extend(font_files)
+        if idle and self._pending_fonts:
+            QTimer.singleShot(0, lambda: self._load_font_chunk(chunk_size))
+    
+    def _load_font_chunk(self, chunk_size: int) -> None:
+        """Load the next chunk of pending fonts and schedule the rest.
+        
+        Args:
+            chunk_size: Number of fonts to load.
+        """
+        for _ in range(min(chunk_size, len(self._pending_fonts))):
+            font_file = self._pending_fonts.popleft()
+            if not self.load_font(font_file):
+                print(f"Error loading font: {font_file}")
+        
+        if self._pending_fonts:
+            QTimer.singleShot(0, lambda: self._load_font_chunk(chunk_size))
+    
     def get_font_families(self) -> List[str]:
         """Get a list of available font families.
         
@@ -178,31 +275,39 @@ class ResourceManager:
             str: The contents of the style sheet, or an empty string if loading failed.
         """
         file_path = self.get_path('styles', *path_parts)
-        if not file_path.exists():
-            return ""
-            
+        
+        # Unchanged files are served from the cache instead of being read again
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _read_style(str(file_path), file_path.stat().st_mtime_ns)
         except (IOError, UnicodeDecodeError):
             return ""
     
     def get_backgrounds(self) -> List[Dict[str, Any]]:
         """Get a list of available backgrounds.
         
+        Thumbnails are not decoded here: each entry's 'thumbnail' is None and
+        its 'load_thumbnail' callable loads the pixmap when it is needed.
+        
         Returns:
             List[Dict[str, Any]]: List of background information dictionaries.
         """
         backgrounds = []
         bg_dir = self.resource_dirs['backgrounds']
         
-        for file_path in bg_dir.glob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.bmp']:
-                backgrounds.append({
-                    'name': file_path.stem,
-                    'path': str(file_path),
-                    'thumbnail': self.load_pixmap('backgrounds', file_path.name)
-                })
+        if not bg_dir.is_dir():
+            return backgrounds
+        
+        # scandir entries know their type, so no extra stat per file is needed
+        with os.scandir(bg_dir) as entries:
+            for entry in entries:
+                name, ext = os.path.splitext(entry.name)
+                if ext.lower() in _BACKGROUND_EXTS and entry.is_file():
+                    backgrounds.append({
+                        'name': name,
+                        'path': entry.path,
+                        'thumbnail': None,
+                        'load_thumbnail': partial(self.load_pixmap, 'backgrounds', entry.name)
+                    })
                 
         return backgrounds
     
@@ -33,8 +33,15 @@ setup(
         'python-dotenv>=1.0.0',
         'openai>=0.28.0',
         'requests>=2.28.0',
+        'httpx>=0.23.0',
     ],
     extras_require={
+        'http2': [
+            'h2>=4.1.0',
+        ],
+        'speedups': [
+            'orjson>=3.8.0',
+        ],
         'dev': [
             'pytest>=7.0.0',
             'black>=22.0.0',